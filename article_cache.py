@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+
+from sqlalchemy.orm import joinedload
+
+from models import Article
+
+
+def build_article_view(article):
+    """Flatten an approved article into a plain dict the detail template can render"""
+    return {
+        'id': article.id,
+        'title': article.title,
+        'abstract': article.abstract,
+        'keywords': article.keywords,
+        'category': article.category,
+        'original_filename': article.original_filename,
+        'file_size': article.file_size,
+        'download_count': article.download_count,
+        'submitted_at': article.submitted_at,
+        'reviewed_at': article.reviewed_at,
+        'author_id': article.author_id,
+        'author': {'full_name': article.author.full_name},
+        'reviewer': {'full_name': article.reviewer.full_name} if article.reviewer else None,
+        'is_approved': article.is_approved,
+        'is_pending': article.is_pending,
+        'is_rejected': article.is_rejected,
+    }
+
+
+class ArticleViewCache:
+    """Bounded in-memory LRU cache of approved article view models.
+
+    Entries are loaded with a single query (author and reviewer joined in)
+    and dropped whenever the article is reviewed or commented on; downloads
+    only update the cached counter in place.
+    A per-article generation counter stops a load that raced with an
+    invalidation from putting the stale view back. The cache and its
+    invalidation are per-process: invalidating in one worker does not
+    reach the others.
+    """
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self._views = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, article_id):
+        """Return the cached view for an approved article, or None if it is not public"""
+        with self._lock:
+            view = self._views.get(article_id)
+            if view is not None:
+                self._views.move_to_end(article_id)
+                return view
+            generation = self._generations.get(article_id, 0)
+
+        article = Article.query.options(joinedload(Article.author), joinedload(Article.reviewer))\
+            .filter_by(id=article_id, status='approved').first()
+        if article is None:
+            return None
+
+        view = build_article_view(article)
+        with self._lock:
+            # Skip the store if the article was invalidated while we were loading it
+            if self._generations.get(article_id, 0) != generation:
+                return view
+            self._views[article_id] = view
+            self._views.move_to_end(article_id)
+            while len(self._views) > self.max_entries:
+                self._views.popitem(last=False)
+        return view
+
+    def update_download_count(self, article_id, download_count):
+        """Refresh the download counter of a cached view without evicting it"""
+        with self._lock:
+            view = self._views.get(article_id)
+            if view is not None:
+                view['download_count'] = download_count
+
+    def invalidate(self, article_id):
+        """Drop an article's cached view"""
+        with self._lock:
+            self._views.pop(article_id, None)
+            self._generations[article_id] = self._generations.get(article_id, 0) + 1
+
+
+article_view_cache = ArticleViewCache()
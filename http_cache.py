@@ -0,0 +1,95 @@
+import gzip
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from uuid import uuid4
+
+from flask import current_app, make_response, request, session
+from flask_login import current_user
+
+# Minimum HTML body size (bytes) worth gzip-compressing
+GZIP_MIN_SIZE = 1024
+
+_version_lock = threading.Lock()
+# Random per-process id so a restart, deploy or sibling worker never reissues another process's ETags
+_boot_id = uuid4().hex[:8]
+_content_version = 0
+_last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def bump_content_version():
+    """Mark public content as changed (new submission, review, download, ...).
+
+    The stamp is per-process: a bump in one worker does not reach the others.
+    """
+    global _content_version, _last_modified
+    with _version_lock:
+        _content_version += 1
+        # Last-Modified has one-second resolution; always move it forward so
+        # two bumps in the same second still invalidate If-Modified-Since
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        _last_modified = max(now, _last_modified + timedelta(seconds=1))
+
+
+def current_etag():
+    """ETag shared by all public pages for this process's content version"""
+    return f"{_boot_id}-{_content_version}"
+
+
+def _set_cache_headers(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    max_age = current_app.config.get('PUBLIC_PAGE_MAX_AGE', 60)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    response.vary.update(['Cookie', 'Accept-Encoding'])
+    return response
+
+
+def public_page(view):
+    """Serve anonymous visitors with conditional GET support and cache headers.
+
+    Logged-in users, and visitors with pending flash messages, always get
+    a freshly rendered private response.
+    """
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if current_user.is_authenticated or session.get('_flashes'):
+            response = make_response(view(*args, **kwargs))
+            response.headers['Cache-Control'] = 'private, no-cache'
+            response.vary.add('Cookie')
+            return response
+
+        etag = current_etag()
+        last_modified = _last_modified
+
+        # Answer revalidation without rendering the page
+        not_modified = request.if_none_match.contains_weak(etag) if request.if_none_match \
+            else bool(request.if_modified_since and request.if_modified_since >= last_modified)
+        if not_modified:
+            response = current_app.response_class(status=304)
+            return _set_cache_headers(response, etag, last_modified)
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            _set_cache_headers(response, etag, last_modified)
+        return response
+    return wrapped
+
+
+def gzip_response(response):
+    """Gzip-compress HTML responses above GZIP_MIN_SIZE when the client accepts it"""
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype != 'text/html'
+            or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
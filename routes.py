@@ -1,16 +1,25 @@
 import os
-from flask import render_template, request, redirect, url_for, flash, send_from_directory, abort
+from flask import render_template, request, redirect, url_for, flash, send_from_directory, abort, jsonify
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.utils import secure_filename
 from datetime import datetime
-from sqlalchemy import desc
+from sqlalchemy import desc, func, or_
+from sqlalchemy.orm import joinedload
 
 from app import app, db
 from models import User, Article, ArticleComment
 from forms import RegistrationForm, LoginForm, ArticleSubmissionForm, ArticleReviewForm, ChangePasswordForm
 from utils import save_article_file, get_file_size, format_file_size
+from search_index import suggestion_index
+from http_cache import public_page, bump_content_version, gzip_response
+from article_cache import article_view_cache
+
+# Build the in-memory suggestion index once at startup
+with app.app_context():
+    suggestion_index.rebuild()
 
 @app.route('/')
+@public_page
 def index():
     """Home page"""
     # Get trending articles (top 5 by download count)
@@ -52,6 +61,7 @@ def register():
         
         db.session.add(user)
         db.session.commit()
+        bump_content_version()
         
         flash('Registration successful! You can now log in.', 'success')
         return redirect(url_for('login'))
@@ -112,6 +122,7 @@ def submit_article():
             
             db.session.add(article)
             db.session.commit()
+            bump_content_version()
             
             flash('Article submitted successfully! It will be reviewed by our team.', 'success')
             return redirect(url_for('my_articles'))
@@ -134,6 +145,7 @@ def my_articles():
     return render_template('my_articles.html', articles=articles)
 
 @app.route('/articles')
+@public_page
 def articles():
     """List all approved articles"""
     page = request.args.get('page', 1, type=int)
@@ -146,9 +158,12 @@ def articles():
         query = query.filter_by(category=category)
     
     if search:
-        query = query.filter(Article.title.contains(search) | 
-                           Article.abstract.contains(search) |
-                           Article.keywords.contains(search))
+        query = query.join(User, Article.author_id == User.id)\
+            .filter(Article.title.contains(search) | 
+                    Article.abstract.contains(search) |
+                    Article.keywords.contains(search) |
+                    User.username.contains(search) |
+                    (User.first_name + ' ' + User.last_name).contains(search))
     
     articles = query.order_by(desc(Article.submitted_at))\
         .paginate(page=page, per_page=10, error_out=False)
@@ -165,16 +180,44 @@ def articles():
                          current_category=category,
                          search=search)
 
+@app.route('/api/search-suggestions')
+def search_suggestions():
+    """Search-as-you-type suggestions for approved articles"""
+    query = request.args.get('q', '')
+    limit = min(request.args.get('limit', 8, type=int), 20)
+    
+    suggestions = suggestion_index.suggest(query, limit=limit)
+    for suggestion in suggestions:
+        if suggestion['type'] == 'title':
+            suggestion['url'] = url_for('article_detail', id=suggestion['article_id'])
+        else:
+            suggestion['url'] = url_for('articles', search=suggestion['label'])
+    
+    return jsonify(query=query, suggestions=suggestions)
+
 @app.route('/article/<int:id>')
+@public_page
 def article_detail(id):
     """Article detail page"""
-    article = Article.query.get_or_404(id)
+    # Supervisors always get fresh data, including unapproved articles and review comments
+    if current_user.is_authenticated and current_user.is_supervisor():
+        article = Article.query.options(joinedload(Article.author), joinedload(Article.reviewer))\
+            .filter_by(id=id).first_or_404()
+        
+        comment_page = request.args.get('comment_page', 1, type=int)
+        comments = ArticleComment.query.filter_by(article_id=id)\
+            .options(joinedload(ArticleComment.user))\
+            .order_by(ArticleComment.created_at)\
+            .paginate(page=comment_page, per_page=10, error_out=False)
+        
+        return render_template('article_detail.html', article=article, comments=comments)
     
-    # Only show approved articles to non-supervisors
-    if not article.is_approved and not (current_user.is_authenticated and current_user.is_supervisor()):
+    # Everyone else only sees approved articles, served from the in-memory view cache
+    article = article_view_cache.get(id)
+    if article is None:
         abort(404)
     
-    return render_template('article_detail.html', article=article)
+    return render_template('article_detail.html', article=article, comments=None)
 
 @app.route('/download/<int:id>')
 def download_article(id):
@@ -188,6 +231,8 @@ def download_article(id):
     # Increment download count
     article.download_count += 1
     db.session.commit()
+    bump_content_version()
+    article_view_cache.update_download_count(article.id, article.download_count)
     
     return send_from_directory(app.config['UPLOAD_FOLDER'], 
                              article.filename,
@@ -266,6 +311,14 @@ def review_article(id):
             db.session.add(comment)
         
         db.session.commit()
+        bump_content_version()
+        article_view_cache.invalidate(article.id)
+        
+        # Keep the suggestion index in step with the set of approved articles
+        if article.is_approved:
+            suggestion_index.add_article(article)
+        else:
+            suggestion_index.remove_article(article.id)
         
         status_text = 'approved' if form.status.data == 'approved' else 'rejected'
         flash(f'Article "{article.title}" has been {status_text}.', 'success')
@@ -281,13 +334,48 @@ def user_management():
         flash('Access denied. Supervisor privileges required.', 'error')
         return redirect(url_for('index'))
     
-    # Get all authors (users with role 'author')
-    authors = User.query.filter_by(role='author').order_by(User.created_at.desc()).all()
+    page = request.args.get('page', 1, type=int)
+    supervisor_page = request.args.get('supervisor_page', 1, type=int)
+    search = request.args.get('search', '').strip()
+    
+    # Header totals from a single grouped count instead of loading every user
+    role_counts = dict(db.session.query(User.role, func.count(User.id))
+                       .group_by(User.role).all())
+    total_authors = role_counts.get('author', 0)
+    total_supervisors = role_counts.get('supervisor', 0) + role_counts.get('admin', 0)
     
-    # Get all supervisors for reference
-    supervisors = User.query.filter(User.role.in_(['supervisor', 'admin'])).order_by(User.username).all()
+    authors_query = User.query.filter_by(role='author')
+    supervisors_query = User.query.filter(User.role.in_(['supervisor', 'admin']))
     
-    return render_template('user_management.html', authors=authors, supervisors=supervisors)
+    if search:
+        pattern = f'%{search}%'
+        search_filter = or_(User.username.ilike(pattern),
+                            User.email.ilike(pattern),
+                            User.first_name.ilike(pattern),
+                            User.last_name.ilike(pattern))
+        authors_query = authors_query.filter(search_filter)
+        supervisors_query = supervisors_query.filter(search_filter)
+    
+    authors = authors_query.order_by(User.created_at.desc())\
+        .paginate(page=page, per_page=25, error_out=False)
+    supervisors = supervisors_query.order_by(User.username)\
+        .paginate(page=supervisor_page, per_page=25, error_out=False)
+    
+    # Article counts for the visible users only, in one grouped query
+    user_ids = [user.id for user in authors.items + supervisors.items]
+    article_counts = {}
+    if user_ids:
+        article_counts = dict(db.session.query(Article.author_id, func.count(Article.id))
+                              .filter(Article.author_id.in_(user_ids))
+                              .group_by(Article.author_id).all())
+    
+    return render_template('user_management.html',
+                         authors=authors,
+                         supervisors=supervisors,
+                         article_counts=article_counts,
+                         total_authors=total_authors,
+                         total_supervisors=total_supervisors,
+                         search=search)
 
 @app.route('/promote-user/<int:user_id>', methods=['POST'])
 @login_required
@@ -306,6 +394,7 @@ def promote_user(user_id):
     # Promote to supervisor
     user.role = 'supervisor'
     db.session.commit()
+    bump_content_version()
     
     flash(f'Successfully promoted {user.full_name} to supervisor role.', 'success')
     return redirect(url_for('user_management'))
@@ -332,6 +421,7 @@ def demote_user(user_id):
     # Demote to author
     user.role = 'author'
     db.session.commit()
+    bump_content_version()
     
     flash(f'Successfully demoted {user.full_name} to author role.', 'success')
     return redirect(url_for('user_management'))
@@ -363,6 +453,7 @@ def change_password():
     return render_template('change_password.html', form=form)
 
 @app.route('/about')
+@public_page
 def about():
     """About page"""
     return render_template('about.html')
@@ -372,6 +463,11 @@ def utility_processor():
     """Template utility functions"""
     return dict(format_file_size=format_file_size)
 
+@app.after_request
+def compress_response(response):
+    """Gzip large HTML responses"""
+    return gzip_response(response)
+
 @app.errorhandler(404)
 def not_found_error(error):
     return render_template('404.html'), 404
@@ -0,0 +1,136 @@
+import threading
+from bisect import bisect_left, insort
+
+from app import db
+from models import User, Article
+
+
+def normalize_term(text):
+    """Lowercase and collapse whitespace for prefix matching"""
+    return ' '.join((text or '').lower().split())
+
+
+class SuggestionIndex:
+    """In-memory prefix index over approved article titles, keywords and authors.
+
+    Each distinct suggestion is stored once as a ``(term, kind, label, title_id)``
+    tuple in a sorted list, with the ids of the articles that contribute it
+    kept alongside, so a prefix lookup is a binary search followed by a
+    short scan over distinct suggestions. ``title_id`` is the article id for
+    titles (so identically titled articles stay separate) and 0 otherwise.
+    The index lives in the worker process; it is built once at startup and
+    updated incrementally when an article is reviewed.
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._article_ids = {}
+        self._by_article = {}
+        self._lock = threading.Lock()
+
+    def rebuild(self):
+        """Rebuild the index from all approved articles"""
+        rows = db.session.query(Article.id, Article.title, Article.keywords,
+                                User.username, User.first_name, User.last_name)\
+            .join(User, Article.author_id == User.id)\
+            .filter(Article.status == 'approved').all()
+
+        by_article = {}
+        article_ids = {}
+        for row in rows:
+            keys = self._terms_for(row.id, row.title, row.keywords,
+                                   row.username, row.first_name, row.last_name)
+            by_article[row.id] = keys
+            for key in keys:
+                article_ids.setdefault(key, set()).add(row.id)
+
+        entries = sorted(article_ids)
+        with self._lock:
+            self._entries = entries
+            self._article_ids = article_ids
+            self._by_article = by_article
+
+    def add_article(self, article):
+        """Index an approved article, replacing any previous entries for it"""
+        author = article.author
+        keys = self._terms_for(article.id, article.title, article.keywords,
+                               author.username, author.first_name, author.last_name)
+        with self._lock:
+            self._remove_locked(article.id)
+            for key in keys:
+                ids = self._article_ids.get(key)
+                if ids is None:
+                    ids = self._article_ids[key] = set()
+                    insort(self._entries, key)
+                ids.add(article.id)
+            self._by_article[article.id] = keys
+
+    def remove_article(self, article_id):
+        """Drop an article from the index (e.g. when it is rejected)"""
+        with self._lock:
+            self._remove_locked(article_id)
+
+    def suggest(self, prefix, limit=8):
+        """Return up to ``limit`` unique suggestions whose terms start with ``prefix``"""
+        prefix = normalize_term(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            entries = self._entries
+            i = bisect_left(entries, (prefix,))
+            # Bound the scan so very common prefixes stay cheap
+            end = min(len(entries), i + limit * 20)
+            while i < end and entries[i][0].startswith(prefix):
+                term, kind, label, title_id = entries[i]
+                key = (kind, title_id if kind == 'title' else label.lower())
+                if key not in seen:
+                    seen.add(key)
+                    suggestion = {'type': kind, 'label': label}
+                    # Only titles point at one article; keyword and author suggestions link by label
+                    if kind == 'title':
+                        suggestion['article_id'] = title_id
+                    results.append(suggestion)
+                    if len(results) >= limit:
+                        break
+                i += 1
+        return results
+
+    def _remove_locked(self, article_id):
+        for key in self._by_article.pop(article_id, []):
+            ids = self._article_ids.get(key)
+            if ids is None:
+                continue
+            ids.discard(article_id)
+            if not ids:
+                del self._article_ids[key]
+                i = bisect_left(self._entries, key)
+                if i < len(self._entries) and self._entries[i] == key:
+                    del self._entries[i]
+
+    @staticmethod
+    def _terms_for(article_id, title, keywords, username, first_name, last_name):
+        terms = set()
+
+        # Index the title from every word start so "learning" matches "Machine Learning"
+        words = normalize_term(title).split()
+        for i in range(len(words)):
+            terms.add((' '.join(words[i:]), 'title', title, article_id))
+
+        for keyword in (keywords or '').split(','):
+            keyword = keyword.strip()
+            if keyword:
+                terms.add((normalize_term(keyword), 'keyword', keyword, 0))
+
+        full_name = f"{first_name} {last_name}" if first_name and last_name else username
+        name_words = normalize_term(full_name).split()
+        for i in range(len(name_words)):
+            terms.add((' '.join(name_words[i:]), 'author', full_name, 0))
+        terms.add((normalize_term(username), 'author', full_name, 0))
+
+        return sorted(terms)
+
+
+suggestion_index = SuggestionIndex()
@@ -234,17 +234,9 @@ function initializeTooltips() {
 function initializeSearchEnhancements() {
     const searchInput = document.querySelector('input[name="search"]');
     if (searchInput) {
-        let searchTimeout;
-        
-        searchInput.addEventListener('input', function() {
-            clearTimeout(searchTimeout);
-            searchTimeout = setTimeout(() => {
-                // Auto-submit search after 500ms of inactivity
-                if (this.value.length > 2 || this.value.length === 0) {
-                    this.form.submit();
-                }
-            }, 500);
-        });
+        if (searchInput.dataset.suggestUrl) {
+            initializeSearchSuggestions(searchInput);
+        }
 
         // Clear search button
         const clearBtn = document.createElement('button');
@@ -263,6 +255,81 @@ function initializeSearchEnhancements() {
     }
 }
 
+/**
+ * Search-as-you-type suggestions from the JSON suggestion endpoint
+ */
+function initializeSearchSuggestions(searchInput) {
+    const list = document.createElement('div');
+    list.className = 'list-group position-absolute w-100 shadow-sm d-none';
+    list.style.zIndex = '1050';
+    searchInput.parentNode.appendChild(list);
+
+    const icons = { title: 'fa-file-alt', keyword: 'fa-hashtag', author: 'fa-user' };
+    let suggestTimeout;
+    let controller;
+
+    function hideSuggestions() {
+        list.classList.add('d-none');
+        list.innerHTML = '';
+    }
+
+    function renderSuggestions(suggestions) {
+        list.innerHTML = '';
+        if (suggestions.length === 0) {
+            hideSuggestions();
+            return;
+        }
+        suggestions.forEach(suggestion => {
+            const item = document.createElement('a');
+            item.className = 'list-group-item list-group-item-action';
+            item.href = suggestion.url;
+
+            const icon = document.createElement('i');
+            icon.className = `fas ${icons[suggestion.type] || 'fa-search'} me-2 text-muted`;
+            item.appendChild(icon);
+            item.appendChild(document.createTextNode(suggestion.label));
+            list.appendChild(item);
+        });
+        list.classList.remove('d-none');
+    }
+
+    searchInput.addEventListener('input', function() {
+        clearTimeout(suggestTimeout);
+        const query = this.value.trim();
+        if (query.length === 0) {
+            hideSuggestions();
+            return;
+        }
+        suggestTimeout = setTimeout(() => {
+            if (controller) {
+                controller.abort();
+            }
+            controller = new AbortController();
+            const url = `${searchInput.dataset.suggestUrl}?q=${encodeURIComponent(query)}`;
+            fetch(url, { signal: controller.signal })
+                .then(response => response.json())
+                .then(data => renderSuggestions(data.suggestions))
+                .catch(error => {
+                    if (error.name !== 'AbortError') {
+                        hideSuggestions();
+                    }
+                });
+        }, 150);
+    });
+
+    searchInput.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') {
+            hideSuggestions();
+        }
+    });
+
+    document.addEventListener('click', function(e) {
+        if (!list.contains(e.target) && e.target !== searchInput) {
+            hideSuggestions();
+        }
+    });
+}
+
 /**
  * Article Interactions
  */